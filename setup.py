@@ -17,7 +17,7 @@ EXTRAS = {
     "openai": ["openai>=1.52.0"],
     "anthropic": ["anthropic>=0.34.0"],
     "google": ["google-genai>=0.6.0"],
-    "test": ["pytest>=8.3.0", "pytest-cov>=4.1.0", "pytest-asyncio>=0.21.0", "hypothesis>=6.0.0"],
+    "test": ["pytest>=8.3.0", "pytest-cov>=4.1.0", "pytest-asyncio>=0.21.0", "hypothesis>=6.0.0", "pytest-xdist>=3.5.0"],
 }
 
 # Convenience bundles
@@ -129,7 +129,26 @@ class BaseLLMProvider(ABC):
         # Build messages using helper method
         messages = self._build_messages(system_prompt, user_prompt)
         
-        # Call LiteLLM with stream=True
+        # Validation above runs on call; the request starts on first iteration
+        return self._stream_impl(model, messages, **kwargs)
+    
+    def _stream_impl(
+        self,
+        model: str,
+        messages: List[Dict],
+        **kwargs
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Call LiteLLM with stream=True and yield structured text chunks.
+        
+        Args:
+            model: Model identifier
+            messages: Message array
+            **kwargs: Optional parameters (temperature, max_tokens, etc.)
+        
+        Yields:
+            Dictionary with "data" (text content) and "raw_chunks" (raw chunk object) keys
+        """
         response = self._call_litellm(
             model=model,
             messages=messages,
@@ -334,7 +353,6 @@ class BaseLLMProvider(ABC):
             ValidationError: When required parameters are missing or invalid
         """
         from .exceptions import ValidationError
-        from .parser_integration import parse_streaming_response
         
         # Validate required parameters
         if not model:
@@ -359,6 +377,34 @@ class BaseLLMProvider(ABC):
         # Build messages using helper method
         messages = self._build_messages(system_prompt, augmented_prompt)
         
+        # Validation above runs on call; the request starts on first iteration
+        return self._structured_streaming_output_impl(
+            model, messages, response_format, output_schema, **kwargs
+        )
+    
+    def _structured_streaming_output_impl(
+        self,
+        model: str,
+        messages: List[Dict],
+        response_format: Dict,
+        output_schema: Type[BaseModel],
+        **kwargs
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Call LiteLLM with stream=True and yield parsed Pydantic objects.
+        
+        Args:
+            model: Model identifier
+            messages: Message array
+            response_format: Response format built from output_schema
+            output_schema: Pydantic BaseModel class defining expected structure
+            **kwargs: Optional parameters (temperature, max_tokens, etc.)
+        
+        Yields:
+            Result dictionaries from parse_streaming_response
+        """
+        from .parser_integration import parse_streaming_response
+        
         # Call LiteLLM with stream=True and response_format
         response = self._call_litellm(
             model=model,
@@ -0,0 +1,27 @@
+"""
+Shared builders for mocked LiteLLM responses.
+
+Responses are plain SimpleNamespace graphs; nothing asserts on them through
+the Mock API. Each call builds a fresh graph, so tests can mutate what they
+get without affecting one another.
+"""
+from types import SimpleNamespace as NS
+from typing import Optional
+
+
+def make_completion_response(content: Optional[str]) -> NS:
+    """Non-streaming response whose first choice carries message.content."""
+    return NS(choices=[NS(message=NS(content=content, tool_calls=None))])
+
+
+def make_stream_chunk(content: Optional[str]) -> NS:
+    """Streaming chunk whose first choice carries delta.content."""
+    return NS(choices=[NS(delta=NS(content=content))])
+
+
+def make_tool_response(name: Optional[str], arguments: Optional[str] = None) -> NS:
+    """Non-streaming response with one tool call, or tool_calls=None when name is None."""
+    tool_calls = None
+    if name is not None:
+        tool_calls = [NS(function=NS(name=name, arguments=arguments))]
+    return NS(choices=[NS(message=NS(content=None, tool_calls=tool_calls))])
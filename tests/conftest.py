@@ -0,0 +1,17 @@
+"""
+Shared pytest configuration.
+
+Hypothesis runs the "dev" profile by default; set HYPOTHESIS_PROFILE=ci for
+the full example count and shrinking.
+"""
+import os
+
+from hypothesis import Phase, settings
+
+# Local runs skip the example database (so there is nothing to reuse) and
+# shrinking; ci keeps every phase so failures replay and shrink
+settings.register_profile(
+    "dev", max_examples=25, database=None, phases=[Phase.explicit, Phase.generate]
+)
+settings.register_profile("ci", max_examples=100)
+settings.load_profile(os.environ.get("HYPOTHESIS_PROFILE", "dev"))
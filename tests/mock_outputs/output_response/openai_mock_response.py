@@ -4,7 +4,7 @@ Load saved raw OpenAI API responses and simulate streaming exactly as LLM return
 """
 import os
 import json
-from typing import Iterator, Dict, Any
+from typing import Iterator, Dict, Any, List, Optional
 from openai.types.chat import ChatCompletion, ChatCompletionChunk
 from openai.types.chat.chat_completion import Choice
 from openai.types.chat.chat_completion_chunk import Choice as ChunkChoice, ChoiceDelta
@@ -13,15 +13,52 @@ import time
 RAW_DATA_DIR = os.path.join(os.path.dirname(__file__), "..", "raw_data", "openai")
 
 
+def _latest_capture(filepath: str) -> Optional[str]:
+    """Path of a capture file or its zstd-compressed .zst copy, whichever is newer; None when neither exists"""
+    candidates = [path for path in (filepath, filepath + ".zst") if os.path.exists(path)]
+    if not candidates:
+        return None
+    return max(candidates, key=os.path.getmtime)
+
+
+def _read_capture(path: str) -> str:
+    """Read a capture file, decompressing it when it is a .zst copy"""
+    if path.endswith(".zst"):
+        import zstandard
+        with open(path, 'rb') as f:
+            return zstandard.ZstdDecompressor().decompress(f.read()).decode('utf-8')
+    
+    with open(path, 'r', encoding='utf-8') as f:
+        return f.read()
+
+
 def load_raw_response(response_type: str) -> Dict[str, Any]:
-    """Load raw response from JSON file"""
+    """Load raw response from its JSON file or the combined all_responses.json capture, whichever is newer"""
     filepath = os.path.join(RAW_DATA_DIR, f"{response_type}.json")
+    single_path = _latest_capture(filepath)
+    combined_path = _latest_capture(os.path.join(RAW_DATA_DIR, "all_responses.json"))
     
-    if not os.path.exists(filepath):
+    if combined_path is not None and (
+        single_path is None or os.path.getmtime(combined_path) > os.path.getmtime(single_path)
+    ):
+        combined = json.loads(_read_capture(combined_path))
+        if response_type in combined:
+            return combined[response_type]
+    
+    if single_path is None:
         raise FileNotFoundError(f"Raw data file not found: {filepath}")
+    return json.loads(_read_capture(single_path))
+
+
+def load_raw_chunks(response_type: str) -> List[Dict[str, Any]]:
+    """Load streamed chunks from a JSON Lines capture, falling back to the older JSON capture"""
+    filepath = os.path.join(RAW_DATA_DIR, f"{response_type}.jsonl")
+    
+    if not os.path.exists(filepath):
+        return load_raw_response(response_type).get("chunks", [])
     
     with open(filepath, 'r', encoding='utf-8') as f:
-        return json.load(f)
+        return [json.loads(line) for line in f if line.strip()]
 
 
 def get_simple_text_response() -> ChatCompletion:
@@ -38,8 +75,7 @@ def get_streaming_response() -> Iterator[ChatCompletionChunk]:
     Load and yield streaming chunks as ChatCompletionChunk objects.
     Simulates exactly what OpenAI streaming API returns.
     """
-    data = load_raw_response("streaming")
-    chunks = data.get("chunks", [])
+    chunks = load_raw_chunks("streaming")
     
     for chunk_data in chunks:
         time.sleep(0.002)
@@ -59,8 +95,7 @@ def get_streaming_structured_output_response() -> Iterator[ChatCompletionChunk]:
     Load and yield streaming chunks as ChatCompletionChunk objects.
     Simulates exactly what OpenAI streaming API returns.
     """
-    data = load_raw_response("streaming_structured_output")
-    chunks = data.get("chunks", [])
+    chunks = load_raw_chunks("streaming_structured_output")
     
     for chunk_data in chunks:
         time.sleep(0.002)
@@ -79,8 +114,7 @@ def get_streaming_tool_call_response() -> Iterator[ChatCompletionChunk]:
     Load and yield streaming chunks as ChatCompletionChunk objects.
     Simulates exactly what OpenAI streaming API returns.
     """
-    data = load_raw_response("streaming_tool_call")
-    chunks = data.get("chunks", [])
+    chunks = load_raw_chunks("streaming_tool_call")
     
     for chunk_data in chunks:
         time.sleep(0.002)
@@ -1,5 +1,10 @@
+import io
 import os
+import sys
 import json
+import threading
+from contextlib import redirect_stdout
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from anthropic import Anthropic
 from dotenv import load_dotenv
@@ -24,12 +29,25 @@ def save_raw_response(response_type: str, data: dict):
     filename = f"{response_type}.json"
     filepath = os.path.join(RAW_DATA_DIR, filename)
     
-    with open(filepath, 'w', encoding='utf-8') as f:
-        json.dump(data, f, indent=2, ensure_ascii=False, default=str)
+    payload = json.dumps(data, indent=2, ensure_ascii=False, default=str).encode('utf-8')
+    fd = os.open(filepath, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        view = memoryview(payload)
+        while view:
+            view = view[os.write(fd, view):]
+    finally:
+        os.close(fd)
     
     print(f"✅ Saved raw response to: {filepath}")
     return filepath
 
+# Shared instruction appended to structured output prompts
+_WEATHER_INSTRUCTION_SUFFIX = (
+    "\n\nProvide weather information for exactly 5 major cities. Return a JSON object with a 'cities' array."
+    " Each city object should have 'city' (name), 'temperature_c' (number), and 'condition' (string) fields."
+    " Example format: {\"cities\": [{\"city\": \"Tokyo\", \"temperature_c\": 15, \"condition\": \"Cloudy\"}]}"
+)
+
 # --- 1️⃣ Plain text call ---
 def simple_text_call(prompt: str, model: str = model_2):
     message = client.messages.create(
@@ -82,7 +100,7 @@ def streaming_call(prompt: str, model: str = model_2):
 
 # --- 3️⃣ Structured output (JSON schema enforced) ---
 def structured_output_call(prompt: str, model: str = model):
-    instruction = f"{prompt}\n\nProvide weather information for exactly 5 major cities. Return a JSON object with a 'cities' array. Each city object should have 'city' (name), 'temperature_c' (number), and 'condition' (string) fields. Example format: {{\"cities\": [{{\"city\": \"Tokyo\", \"temperature_c\": 15, \"condition\": \"Cloudy\"}}]}}"
+    instruction = prompt + _WEATHER_INSTRUCTION_SUFFIX
     message = client.messages.create(
         model=model,
         max_tokens=1024,
@@ -125,7 +143,7 @@ def streaming_structured_output_call(prompt: str, model: str = model):
 
     stream_events = []
     text_buffer = []
-    instruction = f"{prompt}\n\nProvide weather information for exactly 5 major cities. Return a JSON object with a 'cities' array. Each city object should have 'city' (name), 'temperature_c' (number), and 'condition' (string) fields. Example format: {{\"cities\": [{{\"city\": \"Tokyo\", \"temperature_c\": 15, \"condition\": \"Cloudy\"}}]}}"
+    instruction = prompt + _WEATHER_INSTRUCTION_SUFFIX
 
     with client.messages.stream(
         model=model,
@@ -226,7 +244,7 @@ def streaming_tool_call_example(prompt: str, model: str = model):
 
     print("--- Streaming Tool Call ---")
     stream_events = []
-    partial_calls = {}
+    partial_calls = []
 
     with client.messages.stream(
         model=model,
@@ -245,25 +263,31 @@ def streaming_tool_call_example(prompt: str, model: str = model):
 
                 partial_json = getattr(delta, "partial_json", None)
                 if partial_json is not None:
-                    call_state = partial_calls.setdefault(event.index, {"name": None, "arguments": ""})
-                    call_state["arguments"] += partial_json
+                    while len(partial_calls) <= event.index:
+                        partial_calls.append(None)
+                    call_state = partial_calls[event.index]
+                    if call_state is None:
+                        call_state = partial_calls[event.index] = {"name": None, "arguments_parts": []}
+                    call_state["arguments_parts"].append(partial_json)
 
             elif event_type == "content_block_start":
                 block = getattr(event, "content_block", None)
                 if block and block.type == "tool_use":
+                    while len(partial_calls) <= event.index:
+                        partial_calls.append(None)
                     partial_calls[event.index] = {
                         "name": block.name,
-                        "arguments": ""
+                        "arguments_parts": []
                     }
 
     save_raw_response("streaming_tool_call", {"events": stream_events})
 
     print("\n--- Stream End ---")
     results = []
-    for data in partial_calls.values():
-        if not data.get("name"):
+    for data in partial_calls:
+        if not data or not data["name"]:
             continue
-        arguments_raw = data.get("arguments", "{}")
+        arguments_raw = "".join(data["arguments_parts"]) or "{}"
         try:
             parsed_args = json.loads(arguments_raw)
         except json.JSONDecodeError:
@@ -277,22 +301,70 @@ def streaming_tool_call_example(prompt: str, model: str = model):
 
     return results
 
-# Example usage
-if __name__ == "__main__":
-    print("\n=== Simple Text ===")
-    print(simple_text_call("Tell me a joke about AI."))
+class _ThreadOutput:
+    """Stand-in for sys.stdout that holds back prints from threads with a buffer set"""
+
+    def __init__(self, stdout):
+        self.stdout = stdout
+        self.local = threading.local()
 
-    print("\n=== Streaming ===")
-    streaming_call("Explain quantum computing simply.")
+    def write(self, text):
+        return getattr(self.local, "buffer", self.stdout).write(text)
 
-    print("\n=== Structured Output ===")
-    print(structured_output_call("What's the weather in Tokyo?"))
+    def __getattr__(self, name):
+        return getattr(self.stdout, name)
 
-    print("\n=== Streaming Structured Output ===")
-    print(streaming_structured_output_call("Stream the weather in Paris."))
 
-    print("\n=== Tool Call ===")
-    print(tool_call_example("Get me the weather in Berlin."))
+def _run_buffered(output, func, prompt):
+    """Run one example with its prints held back; return (printed text, result)"""
+    buffer = output.local.buffer = io.StringIO()
+    try:
+        result = func(prompt)
+    finally:
+        del output.local.buffer
+    return buffer.getvalue(), result
+
+
+def _print_result(title, result, printed=""):
+    print(f"\n=== {title} ===")
+    print(printed, end="")
+    if result is not None:
+        print(result)
+
+
+def run_all():
+    """Run the non-streaming examples concurrently, then each streaming example on its own.
+
+    Streaming examples print as tokens arrive, so running them side by side
+    would interleave their output. The concurrent examples' prints are held
+    back and shown under each example's header, in order.
+    """
+    examples = [
+        ("Simple Text", simple_text_call, "Tell me a joke about AI."),
+        ("Structured Output", structured_output_call, "What's the weather in Tokyo?"),
+        ("Tool Call", tool_call_example, "Get me the weather in Berlin."),
+    ]
+    output = _ThreadOutput(sys.stdout)
+    with redirect_stdout(output), ThreadPoolExecutor(max_workers=len(examples)) as executor:
+        futures = [
+            (title, executor.submit(_run_buffered, output, func, prompt)) for title, func, prompt in examples
+        ]
+        for title, future in futures:
+            printed, result = future.result()
+            _print_result(title, result, printed)
+    
+    streaming_examples = [
+        ("Streaming", streaming_call, "Explain quantum computing simply."),
+        ("Streaming Structured Output", streaming_structured_output_call, "Stream the weather in Paris."),
+        ("Streaming Tool Call", streaming_tool_call_example, "Stream the weather request for Rome."),
+    ]
+    for title, func, prompt in streaming_examples:
+        # Header first, since these print as they stream
+        print(f"\n=== {title} ===")
+        result = func(prompt)
+        if result is not None:
+            print(result)
 
-    print("\n=== Streaming Tool Call ===")
-    print(streaming_tool_call_example("Stream the weather request for Rome."))
+# Example usage
+if __name__ == "__main__":
+    run_all()
@@ -1,5 +1,10 @@
+import io
 import os
+import sys
 import json
+import threading
+from contextlib import redirect_stdout
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from google import genai
 from google.genai import types
@@ -23,8 +28,14 @@ def save_raw_response(response_type: str, data: dict):
     filename = f"{response_type}.json"
     filepath = os.path.join(RAW_DATA_DIR, filename)
     
-    with open(filepath, 'w', encoding='utf-8') as f:
-        json.dump(data, f, indent=2, ensure_ascii=False, default=str)
+    payload = json.dumps(data, indent=2, ensure_ascii=False, default=str).encode('utf-8')
+    fd = os.open(filepath, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        view = memoryview(payload)
+        while view:
+            view = view[os.write(fd, view):]
+    finally:
+        os.close(fd)
     
     print(f"✅ Saved raw response to: {filepath}")
     return filepath
@@ -43,6 +54,12 @@ def _extract_chunk_text(chunk):
             return "".join(filter(None, part_texts))
     return ""
 
+# Shared instruction appended to structured output prompts
+_WEATHER_INSTRUCTION_SUFFIX = (
+    "\n\nProvide weather information for exactly 5 major cities."
+    " Each entry should have city name, temperature in Celsius, and weather condition."
+)
+
 # --- 1️⃣ Plain text call ---
 def simple_text_call(prompt: str, model_name: str = model):
     response = client.models.generate_content(
@@ -74,7 +91,7 @@ def streaming_call(prompt: str, model_name: str = model):
 
 # --- 3️⃣ Structured output (JSON schema enforced) ---
 def structured_output_call(prompt: str, model_name: str = model):
-    enhanced_prompt = f"{prompt}\n\nProvide weather information for exactly 5 major cities. Each entry should have city name, temperature in Celsius, and weather condition."
+    enhanced_prompt = prompt + _WEATHER_INSTRUCTION_SUFFIX
     response = client.models.generate_content(
         model=model_name,
         contents=enhanced_prompt,
@@ -109,7 +126,7 @@ def structured_output_call(prompt: str, model_name: str = model):
 
 
 def streaming_structured_output_call(prompt: str, model_name: str = model):
-    enhanced_prompt = f"{prompt}\n\nProvide weather information for exactly 5 major cities. Each entry should have city name, temperature in Celsius, and weather condition."
+    enhanced_prompt = prompt + _WEATHER_INSTRUCTION_SUFFIX
     config = types.GenerateContentConfig(
         response_mime_type="application/json",
         response_schema={
@@ -273,22 +290,70 @@ def streaming_tool_call_example(prompt: str, model_name: str = model):
 
     return results
 
-# Example usage
-if __name__ == "__main__":
-    print("\n=== Simple Text ===")
-    simple_text_call("Tell me a joke about AI.")
+class _ThreadOutput:
+    """Stand-in for sys.stdout that holds back prints from threads with a buffer set"""
 
-    print("\n=== Streaming ===")
-    streaming_call("Explain quantum computing simply.")
+    def __init__(self, stdout):
+        self.stdout = stdout
+        self.local = threading.local()
 
-    print("\n=== Structured Output ===")
-    print(structured_output_call("What's the weather in Tokyo?"))
+    def write(self, text):
+        return getattr(self.local, "buffer", self.stdout).write(text)
 
-    print("\n=== Streaming Structured Output ===")
-    print(streaming_structured_output_call("Stream the weather in Paris."))
+    def __getattr__(self, name):
+        return getattr(self.stdout, name)
 
-    print("\n=== Tool Call ===")
-    print(tool_call_example("Get me the weather in Berlin."))
 
-    print("\n=== Streaming Tool Call ===")
-    print(streaming_tool_call_example("Stream the weather request for Rome."))
+def _run_buffered(output, func, prompt):
+    """Run one example with its prints held back; return (printed text, result)"""
+    buffer = output.local.buffer = io.StringIO()
+    try:
+        result = func(prompt)
+    finally:
+        del output.local.buffer
+    return buffer.getvalue(), result
+
+
+def _print_result(title, result, printed=""):
+    print(f"\n=== {title} ===")
+    print(printed, end="")
+    if result is not None:
+        print(result)
+
+
+def run_all():
+    """Run the non-streaming examples concurrently, then each streaming example on its own.
+
+    Streaming examples print as tokens arrive, so running them side by side
+    would interleave their output. The concurrent examples' prints are held
+    back and shown under each example's header, in order.
+    """
+    examples = [
+        ("Simple Text", simple_text_call, "Tell me a joke about AI."),
+        ("Structured Output", structured_output_call, "What's the weather in Tokyo?"),
+        ("Tool Call", tool_call_example, "Get me the weather in Berlin."),
+    ]
+    output = _ThreadOutput(sys.stdout)
+    with redirect_stdout(output), ThreadPoolExecutor(max_workers=len(examples)) as executor:
+        futures = [
+            (title, executor.submit(_run_buffered, output, func, prompt)) for title, func, prompt in examples
+        ]
+        for title, future in futures:
+            printed, result = future.result()
+            _print_result(title, result, printed)
+    
+    streaming_examples = [
+        ("Streaming", streaming_call, "Explain quantum computing simply."),
+        ("Streaming Structured Output", streaming_structured_output_call, "Stream the weather in Paris."),
+        ("Streaming Tool Call", streaming_tool_call_example, "Stream the weather request for Rome."),
+    ]
+    for title, func, prompt in streaming_examples:
+        # Header first, since these print as they stream
+        print(f"\n=== {title} ===")
+        result = func(prompt)
+        if result is not None:
+            print(result)
+
+# Example usage
+if __name__ == "__main__":
+    run_all()
@@ -1,11 +1,39 @@
+import io
 import os
+import sys
+import atexit
+import functools
 import json
+import logging
+import time
+import pathlib
+import threading
+from contextlib import nullcontext, redirect_stdout
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from openai import OpenAI
+from types import MappingProxyType
+from typing import Dict
+from openai import APIError, OpenAI
+from openai.types.chat import ChatCompletionChunk
 from dotenv import load_dotenv
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# orjson.JSONDecodeError subclasses json.JSONDecodeError, so existing handlers still apply
+_loads = orjson.loads if orjson is not None else json.loads
+
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
 load_dotenv()
 
+logger = logging.getLogger(__name__)
+
 # Initialize client (base_url can be customized)
 client = OpenAI(
     api_key=os.getenv("OPENAI_API_KEY"),
@@ -14,43 +42,309 @@ client = OpenAI(
 model = os.getenv("OPENAI_MODEL")
 
 # Directory for saving raw data
-RAW_DATA_DIR = os.path.join(os.path.dirname(__file__), "..","..", "raw_data", "openai")
-os.makedirs(RAW_DATA_DIR, exist_ok=True)
+RAW_DATA_DIR = pathlib.Path(__file__).resolve().parents[2] / "raw_data" / "openai"
+RAW_DATA_DIR.mkdir(parents=True, exist_ok=True)
+
+# Streamed chunks are only recorded when regenerating fixtures (STREAMSHAPE_CAPTURE_RAW=1)
+_CAPTURE_RAW = os.getenv("STREAMSHAPE_CAPTURE_RAW") == "1"
+
+# Non-streaming captures are queued here and written together when the script exits
+_PENDING: Dict[str, bytes] = {}
+# Also write one {response_type}.json per capture (STREAMSHAPE_SPLIT_RAW=1)
+_SPLIT_RAW = os.getenv("STREAMSHAPE_SPLIT_RAW") == "1"
+# Write captures as zstd-compressed .zst files (STREAMSHAPE_COMPRESS_RAW=1, needs zstandard)
+_COMPRESS_RAW = os.getenv("STREAMSHAPE_COMPRESS_RAW") == "1"
+
+
+@functools.lru_cache(maxsize=None)
+def _zstd_compressor():
+    """Create the zstd compressor on first use so zstandard stays optional"""
+    import zstandard
+    return zstandard.ZstdCompressor(level=3, threads=-1)
+
+
+def _write_file(filepath: pathlib.Path, payload: bytes):
+    """Write payload to filepath with a single open/write/close"""
+    if _COMPRESS_RAW:
+        filepath = filepath.with_name(filepath.name + ".zst")
+        payload = _zstd_compressor().compress(payload)
+    
+    flags = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0) | getattr(os, "O_CLOEXEC", 0)
+    fd = os.open(filepath, flags, 0o644)
+    try:
+        view = memoryview(payload)
+        while view:
+            view = view[os.write(fd, view):]
+        # Fixtures are write-once; keep them from crowding the page cache
+        if hasattr(os, "posix_fadvise"):
+            os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_DONTNEED)
+    finally:
+        os.close(fd)
+    
+    logger.debug("Saved raw response to: %s", filepath)
+
+
+def save_raw_json(response_type: str, response):
+    """Queue a pydantic response, serialized straight to JSON without building a dict first"""
+    _PENDING[response_type] = response.model_dump_json(indent=2).encode('utf-8')
 
-def save_raw_response(response_type: str, data: dict):
-    """Save raw API response to JSON file"""
-    filename = f"{response_type}.json"
-    filepath = os.path.join(RAW_DATA_DIR, filename)
+
+def _flush_pending():
+    """Write every queued response to all_responses.json in one go"""
+    if not _PENDING:
+        return
     
-    with open(filepath, 'w', encoding='utf-8') as f:
-        json.dump(data, f, indent=2, ensure_ascii=False, default=str)
+    if _SPLIT_RAW:
+        for response_type, payload in _PENDING.items():
+            _write_file(RAW_DATA_DIR / f"{response_type}.json", payload)
     
-    print(f"✅ Saved raw response to: {filepath}")
-    return filepath
+    combined = b",\n".join(
+        json.dumps(response_type).encode('utf-8') + b": " + payload for response_type, payload in _PENDING.items()
+    )
+    _write_file(RAW_DATA_DIR / "all_responses.json", b"{\n" + combined + b"\n}\n")
+    _PENDING.clear()
+
+
+atexit.register(_flush_pending)
+
+
+def open_raw_stream(response_type: str):
+    """Open a JSON Lines file that streamed chunks are appended to as they arrive"""
+    if not _CAPTURE_RAW:
+        return nullcontext()
+    filepath = RAW_DATA_DIR / f"{response_type}.jsonl"
+    return open(filepath, 'w', encoding='utf-8', buffering=1 << 16)
+
+
+class _ConsoleBuffer:
+    """Coalesce streamed text into larger stdout writes instead of one flush per delta."""
+
+    def __init__(self, limit: int = 4096, interval: float = 0.05):
+        sys.stdout.flush()
+        self._out = sys.stdout.buffer
+        self._encoding = sys.stdout.encoding or "utf-8"
+        self._buf = bytearray()
+        self._limit = limit
+        self._interval = interval
+        self._last_flush = time.monotonic()
+
+    def write(self, text: str):
+        self._buf += text.encode(self._encoding, errors="replace")
+        if len(self._buf) >= self._limit or time.monotonic() - self._last_flush > self._interval:
+            self.flush()
+
+    def flush(self):
+        if self._buf:
+            self._out.write(self._buf)
+            self._buf.clear()
+        self._out.flush()
+        self._last_flush = time.monotonic()
+
+
+class _Tee:
+    """Send each streamed piece to the console and collect its UTF-8 bytes in one call."""
+
+    __slots__ = ("buf", "out")
+
+    def __init__(self, out):
+        self.buf = bytearray()
+        self.out = out
 
+    def write(self, text: str):
+        self.buf += text.encode("utf-8")
+        self.out.write(text)
 
-def _extract_delta_text(content):
+
+def _drain(stream, max_batch: int = 32):
+    """
+    Yield lists of chunks parsed from each block read off the socket.
+
+    Each read returns whatever the socket already holds (no chunk_size, so
+    httpx does not hold data back to fill a block), and every complete SSE
+    event in it is decoded together. The per-chunk loop overhead is paid
+    once per burst instead of once per token without delaying the output.
+    """
+    pending = b""
+    try:
+        for block in stream.response.iter_bytes():
+            pending = (pending + block).replace(b"\r\n", b"\n")
+            *events, pending = pending.split(b"\n\n")
+            batch = []
+            for event in events:
+                data = b"\n".join(
+                    line[6:] if line.startswith(b"data: ") else line[5:]
+                    for line in event.split(b"\n")
+                    if line.startswith(b"data:")
+                )
+                if not data:
+                    continue
+                if data.startswith(b"[DONE]"):
+                    if batch:
+                        yield batch
+                    return
+
+                payload = json.loads(data)
+                if isinstance(payload, dict) and payload.get("error"):
+                    error = payload["error"]
+                    message = error.get("message") if isinstance(error, dict) else None
+                    raise APIError(
+                        message=message or "An error occurred during streaming",
+                        request=stream.response.request,
+                        body=error,
+                    )
+
+                # Built leniently like the SDK's own stream decoder, so OpenAI-compatible
+                # servers that omit fields such as created/object still work
+                batch.append(ChatCompletionChunk.construct(**payload))
+                if len(batch) >= max_batch:
+                    yield batch
+                    batch = []
+            if batch:
+                yield batch
+    finally:
+        stream.close()
+
+
+def _extract_delta_text(content, _getattr=getattr, _isinstance=isinstance, _dict=dict):
     """Normalize streamed delta content into plain text."""
+    # Plain strings are by far the common case; the defaults above bind builtins as locals
+    if content.__class__ is str:
+        return content
     if not content:
         return ""
-    if isinstance(content, str):
+    if _isinstance(content, str):
         return content
 
-    text_parts = []
+    iterator = content if _isinstance(content, (list, tuple)) else (content,)
     try:
-        iterator = content if isinstance(content, (list, tuple)) else [content]
-        for part in iterator:
-            if part is None:
-                continue
-            text_value = getattr(part, "text", None)
-            if text_value:
-                text_parts.append(text_value)
-            elif isinstance(part, dict) and part.get("text"):
-                text_parts.append(part["text"])
+        return "".join([
+            _getattr(part, "text", None)
+            or (part.get("text") if _isinstance(part, _dict) else None)
+            or ""
+            for part in iterator
+            if part is not None
+        ])
     except TypeError:
-        pass
+        return ""
+
+
+def _drive_stream(stream, response_type: str, on_text, on_tool=None):
+    """
+    Run one streamed completion through the shared chunk loop.
+
+    Each chunk is recorded when raw capture is enabled, non-empty delta text
+    is passed to on_text, and every tool call delta is passed to on_tool.
+    """
+    _extract = _extract_delta_text
+    with open_raw_stream(response_type) as raw_file:
+        write_raw = raw_file.write if raw_file is not None else None
+        for batch in _drain(stream):
+            for chunk in batch:
+                if write_raw is not None:
+                    write_raw(chunk.model_dump_json())
+                    write_raw("\n")
+                choices = chunk.choices
+                if not choices:
+                    continue
+
+                delta = choices[0].delta
+                content = delta.content
+                if content:
+                    piece = _extract(content)
+                    if piece:
+                        on_text(piece)
+
+                if on_tool is not None:
+                    tool_deltas = delta.tool_calls
+                    if tool_deltas:
+                        for tool_delta in tool_deltas:
+                            on_tool(tool_delta)
+
+
+# Request payloads shared by every call; built once at import
+_WEATHER_SCHEMA = MappingProxyType({
+    "name": "weather_cities",
+    "schema": {
+        "type": "object",
+        "properties": {
+            "cities": {
+                "type": "array",
+                "items": {
+                    "type": "object",
+                    "properties": {
+                        "city": {"type": "string"},
+                        "temperature_c": {"type": "number"},
+                        "condition": {"type": "string"}
+                    },
+                    "required": ["city", "temperature_c", "condition"]
+                },
+                "description": "List of cities with weather information"
+            }
+        },
+        "required": ["cities"]
+    }
+})
+
+_WEATHER_INSTRUCTION_SUFFIX = (
+    "\n\nProvide weather information for exactly 5 major cities."
+    " Each entry should have city name, temperature in Celsius, and weather condition."
+)
+
+_WEATHER_TOOLS = [
+    {
+        "type": "function",
+        "function": {
+            "name": "get_weather",
+            "description": "Get weather info for a city.",
+            "parameters": {
+                "type": "object",
+                "properties": {
+                    "city": {"type": "string"}
+                },
+                "required": ["city"]
+            }
+        }
+    }
+]
+
+# MCP tools follow OpenAI function calling format
+_MCP_TOOLS = [
+    {
+        "type": "function",
+        "function": {
+            "name": "read_file",
+            "description": "Read contents of a file from the filesystem.",
+            "parameters": {
+                "type": "object",
+                "properties": {
+                    "path": {
+                        "type": "string",
+                        "description": "The file path to read"
+                    }
+                },
+                "required": ["path"]
+            }
+        }
+    },
+    {
+        "type": "function",
+        "function": {
+            "name": "list_directory",
+            "description": "List contents of a directory.",
+            "parameters": {
+                "type": "object",
+                "properties": {
+                    "path": {
+                        "type": "string",
+                        "description": "The directory path to list"
+                    }
+                },
+                "required": ["path"]
+            }
+        }
+    }
+]
 
-    return "".join(text_parts)
 # --- 1️⃣ Plain text call ---
 def simple_text_call(prompt: str, model: str = model):
     response = client.chat.completions.create(
@@ -59,7 +353,7 @@ def simple_text_call(prompt: str, model: str = model):
     )
     
     # Save raw response
-    save_raw_response("simple_text", response.model_dump())
+    save_raw_json("simple_text", response)
     
     return response.choices[0].message.content
 
@@ -72,110 +366,71 @@ def streaming_call(prompt: str, model: str = model):
         stream=True
     )
     
-    chunks = []
-    for chunk in stream:
-        chunks.append(chunk.model_dump())
-        if chunk.choices:
-            delta = chunk.choices[0].delta
-            if delta.content:
-                print(delta.content, end="", flush=True)
-    
-    # Save all chunks
-    save_raw_response("streaming", {"chunks": chunks})
+    console = _ConsoleBuffer()
+    _drive_stream(stream, "streaming", console.write)
     
+    console.flush()
     print("\n--- Stream End ---")
 
 # --- 3️⃣ Structured output (JSON schema enforced) ---
 def structured_output_call(prompt: str, model: str = model):
-    schema = {
-        "name": "weather_cities",
-        "schema": {
-            "type": "object",
-            "properties": {
-                "cities": {
-                    "type": "array",
-                    "items": {
-                        "type": "object",
-                        "properties": {
-                            "city": {"type": "string"},
-                            "temperature_c": {"type": "number"},
-                            "condition": {"type": "string"}
-                        },
-                        "required": ["city", "temperature_c", "condition"]
-                    },
-                    "description": "List of cities with weather information"
-                }
-            },
-            "required": ["cities"]
-        }
-    }
-
-    enhanced_prompt = f"{prompt}\n\nProvide weather information for exactly 5 major cities. Each entry should have city name, temperature in Celsius, and weather condition."
+    enhanced_prompt = prompt + _WEATHER_INSTRUCTION_SUFFIX
     response = client.chat.completions.create(
         model=model,
         messages=[{"role": "user", "content": enhanced_prompt}],
-        response_format={"type": "json_schema", "json_schema": schema}
+        response_format={"type": "json_schema", "json_schema": _WEATHER_SCHEMA}
     )
 
     # Save raw response
-    save_raw_response("structured_output", response.model_dump())
+    save_raw_json("structured_output", response)
 
     data = json.loads(response.choices[0].message.content)
     return data
 
 
 def streaming_structured_output_call(prompt: str, model: str = model):
-    schema = {
-        "name": "weather_cities",
-        "schema": {
-            "type": "object",
-            "properties": {
-                "cities": {
-                    "type": "array",
-                    "items": {
-                        "type": "object",
-                        "properties": {
-                            "city": {"type": "string"},
-                            "temperature_c": {"type": "number"},
-                            "condition": {"type": "string"}
-                        },
-                        "required": ["city", "temperature_c", "condition"]
-                    },
-                    "description": "List of cities with weather information"
-                }
-            },
-            "required": ["cities"]
-        }
-    }
-
     print("--- Streaming Structured Output ---")
-    enhanced_prompt = f"{prompt}\n\nProvide weather information for exactly 5 major cities. Each entry should have city name, temperature in Celsius, and weather condition."
+    enhanced_prompt = prompt + _WEATHER_INSTRUCTION_SUFFIX
     stream = client.chat.completions.create(
         model=model,
         messages=[{"role": "user", "content": enhanced_prompt}],
-        response_format={"type": "json_schema", "json_schema": schema},
+        response_format={"type": "json_schema", "json_schema": _WEATHER_SCHEMA},
         stream=True
     )
 
-    chunks = []
-    buffer = []
-    for chunk in stream:
-        chunks.append(chunk.model_dump())
-        if chunk.choices:
-            delta = chunk.choices[0].delta
-            if delta.content:
-                piece = _extract_delta_text(delta.content)
-                if piece:
-                    buffer.append(piece)
-                    print(piece, end="", flush=True)
-
-    save_raw_response("streaming_structured_output", {"chunks": chunks})
-
+    # Parse the JSON as it streams in so the full payload is not decoded a second time
+    decoded = decoder = None
+    if ijson is not None:
+        decoded = ijson.sendable_list()
+        decoder = ijson.items_coro(decoded, "", use_float=True)
+    console = _ConsoleBuffer()
+    tee = _Tee(console)
+
+    def on_text(piece):
+        nonlocal decoder
+        tee.write(piece)
+        if decoder is not None:
+            try:
+                decoder.send(piece.encode("utf-8"))
+            except ijson.JSONError:
+                decoder = None
+
+    _drive_stream(stream, "streaming_structured_output", on_text)
+
+    console.flush()
     print("\n--- Stream End ---")
-    payload = "".join(buffer).strip()
+    payload = tee.buf.decode("utf-8").strip()
     if not payload:
         return {}
 
+    if decoder is not None:
+        try:
+            decoder.close()
+            if decoded:
+                return decoded[0]
+        except ijson.JSONError:
+            pass
+
     try:
         return json.loads(payload)
     except json.JSONDecodeError:
@@ -184,39 +439,22 @@ def streaming_structured_output_call(prompt: str, model: str = model):
 
 # --- 4️⃣ Tool call (function call simulation) ---
 def tool_call_example(prompt: str, model: str = model):
-    tools = [
-        {
-            "type": "function",
-            "function": {
-                "name": "get_weather",
-                "description": "Get weather info for a city.",
-                "parameters": {
-                    "type": "object",
-                    "properties": {
-                        "city": {"type": "string"}
-                    },
-                    "required": ["city"]
-                }
-            }
-        }
-    ]
-
     response = client.chat.completions.create(
         model=model,
         messages=[{"role": "user", "content": prompt}],
-        tools=tools,
+        tools=_WEATHER_TOOLS,
         tool_choice="auto"
     )
 
     # Save raw response
-    save_raw_response("tool_call", response.model_dump())
+    save_raw_json("tool_call", response)
 
     message = response.choices[0].message
 
     if message.tool_calls:
         for tool_call in message.tool_calls:
             if tool_call.function.name == "get_weather":
-                args = json.loads(tool_call.function.arguments)
+                args = _loads(tool_call.function.arguments)
                 print(f"Tool called: get_weather({args})")
                 # Simulate tool result
                 return {"city": args["city"], "temperature": 25, "condition": "Sunny"}
@@ -225,80 +463,55 @@ def tool_call_example(prompt: str, model: str = model):
 
 
 def streaming_tool_call_example(prompt: str, model: str = model):
-    tools = [
-        {
-            "type": "function",
-            "function": {
-                "name": "get_weather",
-                "description": "Get weather info for a city.",
-                "parameters": {
-                    "type": "object",
-                    "properties": {
-                        "city": {"type": "string"}
-                    },
-                    "required": ["city"]
-                }
-            }
-        }
-    ]
-
     print("--- Streaming Tool Call ---")
     stream = client.chat.completions.create(
         model=model,
         messages=[{"role": "user", "content": prompt}] ,
-        tools=tools,
+        tools=_WEATHER_TOOLS,
         tool_choice="auto",
         stream=True
     )
 
-    chunks = []
-    partial_calls = {}
-    for chunk in stream:
-        chunks.append(chunk.model_dump())
-        if not chunk.choices:
-            continue
+    partial_calls = []
 
-        delta = chunk.choices[0].delta
-        if delta.content:
-            text_piece = _extract_delta_text(delta.content)
-            if text_piece:
-                print(text_piece, end="", flush=True)
+    def on_tool(tool_delta):
+        # Some OpenAI-compatible servers send index: null for a single call
+        if isinstance(tool_delta, dict):
+            index = tool_delta.get("index") or 0
+            function_data = tool_delta.get("function")
+        else:
+            index = getattr(tool_delta, "index", None) or 0
+            function_data = getattr(tool_delta, "function", None)
 
-        tool_deltas = getattr(delta, "tool_calls", None)
-        if not tool_deltas:
-            continue
+        # Indices are small and dense, so a list replaces the dict and the final sort
+        while len(partial_calls) <= index:
+            partial_calls.append({"name": None, "arguments": []})
+        call = partial_calls[index]
 
-        for tool_delta in tool_deltas:
-            index = getattr(tool_delta, "index", 0)
-            call = partial_calls.setdefault(index, {"name": None, "arguments": ""})
+        if function_data:
+            name = getattr(function_data, "name", None) or (function_data.get("name") if isinstance(function_data, dict) else None)
+            if name:
+                call["name"] = name
 
-            function_data = getattr(tool_delta, "function", None)
-            if isinstance(tool_delta, dict):
-                function_data = tool_delta.get("function")
-                index = tool_delta.get("index", index)
-                call = partial_calls.setdefault(index, {"name": None, "arguments": ""})
-
-            if function_data:
-                name = getattr(function_data, "name", None) or (function_data.get("name") if isinstance(function_data, dict) else None)
-                if name:
-                    call["name"] = name
-
-                arguments = getattr(function_data, "arguments", None)
-                if isinstance(function_data, dict):
-                    arguments = function_data.get("arguments")
-                if arguments:
-                    call["arguments"] += arguments
-
-    save_raw_response("streaming_tool_call", {"chunks": chunks, "tool_calls": partial_calls})
+            arguments = getattr(function_data, "arguments", None)
+            if isinstance(function_data, dict):
+                arguments = function_data.get("arguments")
+            if arguments:
+                call["arguments"].append(arguments)
+
+    console = _ConsoleBuffer()
+    _drive_stream(stream, "streaming_tool_call", console.write, on_tool)
+
+    console.flush()
     print("\n--- Stream End ---")
 
     results = []
-    for _, data in sorted(partial_calls.items()):
+    for data in partial_calls:
         if not data["name"]:
             continue
-        arguments = data.get("arguments", "{}")
+        arguments = "".join(data["arguments"]) or "{}"
         try:
-            parsed_args = json.loads(arguments)
+            parsed_args = _loads(arguments)
         except json.JSONDecodeError:
             parsed_args = {"raw": arguments}
 
@@ -316,60 +529,23 @@ def mcp_tool_call_example(prompt: str, model: str = model):
     MCP (Model Context Protocol) servers use OpenAI-compatible API format.
     This example demonstrates calling MCP tools which follow the same pattern.
     """
-    # MCP tools follow OpenAI function calling format
-    mcp_tools = [
-        {
-            "type": "function",
-            "function": {
-                "name": "read_file",
-                "description": "Read contents of a file from the filesystem.",
-                "parameters": {
-                    "type": "object",
-                    "properties": {
-                        "path": {
-                            "type": "string",
-                            "description": "The file path to read"
-                        }
-                    },
-                    "required": ["path"]
-                }
-            }
-        },
-        {
-            "type": "function",
-            "function": {
-                "name": "list_directory",
-                "description": "List contents of a directory.",
-                "parameters": {
-                    "type": "object",
-                    "properties": {
-                        "path": {
-                            "type": "string",
-                            "description": "The directory path to list"
-                        }
-                    },
-                    "required": ["path"]
-                }
-            }
-        }
-    ]
 
     response = client.chat.completions.create(
         model=model,
         messages=[{"role": "user", "content": prompt}],
-        tools=mcp_tools,
+        tools=_MCP_TOOLS,
         tool_choice="auto"
     )
 
     # Save raw response
-    save_raw_response("mcp_tool_call", response.model_dump())
+    save_raw_json("mcp_tool_call", response)
 
     message = response.choices[0].message
 
     if message.tool_calls:
         results = []
         for tool_call in message.tool_calls:
-            args = json.loads(tool_call.function.arguments)
+            args = _loads(tool_call.function.arguments)
             print(f"MCP Tool called: {tool_call.function.name}({args})")
             
             # Simulate MCP tool results
@@ -389,25 +565,71 @@ def mcp_tool_call_example(prompt: str, model: str = model):
     else:
         return message.content
 
-# Example usage
-if __name__ == "__main__":
-    print("\n=== Simple Text ===")
-    print(simple_text_call("Tell me a joke about AI."))
+class _ThreadOutput:
+    """Stand-in for sys.stdout that holds back prints from threads with a buffer set"""
+
+    def __init__(self, stdout):
+        self.stdout = stdout
+        self.local = threading.local()
+
+    def write(self, text):
+        return getattr(self.local, "buffer", self.stdout).write(text)
+
+    def __getattr__(self, name):
+        return getattr(self.stdout, name)
+
+
+def _run_buffered(output, func, prompt):
+    """Run one example with its prints held back; return (printed text, result)"""
+    buffer = output.local.buffer = io.StringIO()
+    try:
+        result = func(prompt)
+    finally:
+        del output.local.buffer
+    return buffer.getvalue(), result
 
-    print("\n=== Streaming ===")
-    streaming_call("Explain quantum computing simply.")
 
-    print("\n=== Structured Output ===")
-    print(structured_output_call("What's the weather in Tokyo?"))
+def _print_result(title, result, printed=""):
+    print(f"\n=== {title} ===")
+    print(printed, end="")
+    if result is not None:
+        print(result)
 
-    print("\n=== Streaming Structured Output ===")
-    print(streaming_structured_output_call("Stream the weather in Paris."))
 
-    print("\n=== Tool Call ===")
-    print(tool_call_example("Get me the weather in Berlin."))
+def run_all():
+    """Run the non-streaming examples concurrently, then each streaming example on its own.
 
-    print("\n=== Streaming Tool Call ===")
-    print(streaming_tool_call_example("Stream the weather request for Rome."))
+    Streaming examples print as tokens arrive, so running them side by side
+    would interleave their output. The concurrent examples' prints are held
+    back and shown under each example's header, in order.
+    """
+    examples = [
+        ("Simple Text", simple_text_call, "Tell me a joke about AI."),
+        ("Structured Output", structured_output_call, "What's the weather in Tokyo?"),
+        ("Tool Call", tool_call_example, "Get me the weather in Berlin."),
+        ("MCP Tool Call", mcp_tool_call_example, "List the files in the current directory."),
+    ]
+    output = _ThreadOutput(sys.stdout)
+    with redirect_stdout(output), ThreadPoolExecutor(max_workers=len(examples)) as executor:
+        futures = [
+            (title, executor.submit(_run_buffered, output, func, prompt)) for title, func, prompt in examples
+        ]
+        for title, future in futures:
+            printed, result = future.result()
+            _print_result(title, result, printed)
+    
+    streaming_examples = [
+        ("Streaming", streaming_call, "Explain quantum computing simply."),
+        ("Streaming Structured Output", streaming_structured_output_call, "Stream the weather in Paris."),
+        ("Streaming Tool Call", streaming_tool_call_example, "Stream the weather request for Rome."),
+    ]
+    for title, func, prompt in streaming_examples:
+        # Header first, since these print as they stream
+        print(f"\n=== {title} ===")
+        result = func(prompt)
+        if result is not None:
+            print(result)
 
-    print("\n=== MCP Tool Call ===")
-    print(mcp_tool_call_example("List the files in the current directory."))
\ No newline at end of file
+# Example usage
+if __name__ == "__main__":
+    run_all()
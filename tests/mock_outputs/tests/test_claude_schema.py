@@ -1,6 +1,7 @@
 import anthropic
 import json
 from typing import Dict, Any, List
+from pydantic import TypeAdapter
 import sys
 import os
 
@@ -15,11 +16,15 @@ from providers_schema.anthropic_schema import (
 
 from mock_outputs.mock_data import anthropic
 
+# Build the validators once; per-call keyword construction re-enters pydantic's slow path
+_MSG_ADAPTER = TypeAdapter(ClaudeMessage)
+_EVT_ADAPTER = TypeAdapter(ClaudeStreamingEvent)
+
 # Schema validation helper
 def validate_and_parse_message(raw_response: Dict[str, Any]) -> ClaudeMessage:
     """Validate and parse API response using ClaudeMessage schema"""
     try:
-        parsed_message = ClaudeMessage(**raw_response)
+        parsed_message = _MSG_ADAPTER.validate_python(raw_response, strict=False, from_attributes=True)
         print("OK Schema validation successful")
         return parsed_message
     except Exception as e:
@@ -30,7 +35,7 @@ def validate_and_parse_message(raw_response: Dict[str, Any]) -> ClaudeMessage:
 def validate_and_parse_streaming_event(event_data: Dict[str, Any]) -> ClaudeStreamingEvent:
     """Validate and parse streaming event using ClaudeStreamingEvent schema"""
     try:
-        parsed_event = ClaudeStreamingEvent(**event_data)
+        parsed_event = _EVT_ADAPTER.validate_python(event_data, strict=False, from_attributes=True)
         return parsed_event
     except Exception as e:
         print(f"ERROR Schema validation failed: {e}")
@@ -73,10 +78,13 @@ def test_simple_text():
         print(f"\nOK Content Block {i+1}:")
         print(f"  - Type: {block.type}")
         if block.type == "thinking" and hasattr(block, 'thinking'):
-            thinking_preview = block.thinking[:100] + "..." if block.thinking and len(block.thinking) > 100 else block.thinking
+            t = block.thinking
+            thinking_preview = t if not t or len(t) <= 100 else t[:100] + "..."
             print(f"  - Thinking: {thinking_preview}")
         elif block.type == "text" and hasattr(block, 'text'):
-            print(f"  - Text: {block.text[:100]}..." if len(block.text) > 100 else f"  - Text: {block.text}")
+            t = block.text
+            text_preview = t if len(t) <= 100 else t[:100] + "..."
+            print(f"  - Text: {text_preview}")
     print()
 
 # Streaming response test
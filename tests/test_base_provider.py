@@ -1,16 +1,22 @@
 """
 Property-based tests for BaseLLMProvider.
+
+Safe under `pytest -n auto`: LiteLLM and the parser are only ever replaced
+through monkeypatch, so no patch outlives the test that installed it.
 """
-import sys
-import os
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+import copy
+import re
 
 import pytest
-from unittest.mock import Mock, patch
-from hypothesis import given, settings, strategies as st, HealthCheck
+from types import SimpleNamespace
+from unittest.mock import Mock
+from hypothesis import example, given, settings, strategies as st, HealthCheck
 from pydantic import BaseModel
+from streamshape import litellm_integration as _li
+from streamshape import parser_integration as _pi
 from streamshape.base import BaseLLMProvider
 from streamshape.exceptions import ValidationError
+from tests._mocks import make_completion_response, make_stream_chunk, make_tool_response
 
 
 class ConcreteProvider(BaseLLMProvider):
@@ -19,16 +25,74 @@ class ConcreteProvider(BaseLLMProvider):
         return "test_provider"
 
 
+class SampleSchema(BaseModel):
+    """Sample schema for structured output tests."""
+    name: str
+    value: int
+
+
+# ValidationError message patterns, compiled once
+_MATCH_MODEL = re.compile(r"model")
+_MATCH_SYSTEM = re.compile(r"system_prompt")
+_MATCH_USER = re.compile(r"user_prompt")
+_MATCH_TOOLS = re.compile(r"tools")
+_MATCH_OUTPUT_SCHEMA = re.compile(r"output_schema")
+_MATCH_MUST_BE_LIST = re.compile(r"must be a list")
+_MATCH_BASEMODEL = re.compile(r"must be a Pydantic BaseModel class")
+
+# Parsed objects the mocked structured streaming parser hands back
+_SAMPLE_1 = SampleSchema(name="test1", value=1)
+_SAMPLE_2 = SampleSchema(name="test2", value=2)
+
+
+# Tool definitions shared by the tool_call tests
+_BASIC_TOOL = [{"type": "function", "function": {"name": "test_tool"}}]
+_WEATHER_TOOL = [
+    {
+        "type": "function",
+        "function": {
+            "name": "get_weather",
+            "description": "Get weather",
+            "parameters": {"type": "object", "properties": {}}
+        }
+    }
+]
+
+
+@pytest.fixture(scope="session")
+def _provider_template():
+    """Provider built once for the whole run."""
+    return ConcreteProvider("test_api_key")
+
+
+@pytest.fixture
+def provider(_provider_template):
+    """Per-test shallow copy of the shared provider."""
+    return copy.copy(_provider_template)
+
+
+@pytest.fixture(autouse=True)
+def mock_completion(monkeypatch):
+    """Replace litellm.completion with a Mock for every test."""
+    m = Mock()
+    monkeypatch.setattr(_li.litellm, "completion", m)
+    return m
+
+
 # Feature: unified-llm-interface, Property 1: Provider instantiation stores credentials
 @given(
     api_key=st.text(min_size=1, max_size=100),
     extra_params=st.dictionaries(
         keys=st.text(min_size=1, max_size=20),
-        values=st.one_of(st.text(), st.integers(), st.floats(allow_nan=False), st.booleans()),
+        values=st.one_of(st.text(max_size=10), st.integers(min_value=-1000, max_value=1000), st.booleans()),
         max_size=5
     )
 )
-@settings(max_examples=100, suppress_health_check=[HealthCheck.too_slow])
+@example(api_key="0123456789", extra_params={})
+@settings(
+    deadline=None,
+    suppress_health_check=[HealthCheck.too_slow, HealthCheck.function_scoped_fixture]
+)
 def test_provider_instantiation_stores_credentials(api_key: str, extra_params: dict):
     """
     Property 1: Provider instantiation stores credentials
@@ -56,10 +120,14 @@ def test_provider_instantiation_stores_credentials(api_key: str, extra_params: d
     api_key=st.text(
         min_size=10,  # Avoid short strings that might coincidentally appear
         max_size=100,
-        alphabet=st.characters(blacklist_categories=('Cs', 'Cc'))  # Avoid control characters
+        alphabet=st.characters(min_codepoint=33, max_codepoint=126)  # Printable ASCII; containment is alphabet-agnostic
     )
 )
-@settings(max_examples=100)
+@example(api_key="secret_key_1234567890")
+@settings(
+    deadline=None,
+    suppress_health_check=[HealthCheck.function_scoped_fixture]
+)
 def test_credentials_are_not_exposed(api_key: str):
     """
     Property 2: Credentials are not exposed
@@ -87,36 +155,38 @@ def test_credentials_are_not_exposed(api_key: str):
 
 
 
-# Unit tests for generate method
-def test_generate_validates_required_parameters():
-    """Test that generate validates required parameters."""
-    provider = ConcreteProvider("test_api_key")
-    
-    # Test missing model
-    with pytest.raises(ValidationError, match="model"):
-        provider.generate("", "system", "user")
-    
-    # Test missing system_prompt
-    with pytest.raises(ValidationError, match="system_prompt"):
-        provider.generate("gpt-4", "", "user")
-    
-    # Test missing user_prompt
-    with pytest.raises(ValidationError, match="user_prompt"):
-        provider.generate("gpt-4", "system", "")
+# Unit tests for required parameter validation
+@pytest.mark.parametrize("method,args,match", [
+    ("generate", ("", "system", "user"), _MATCH_MODEL),
+    ("generate", ("gpt-4", "", "user"), _MATCH_SYSTEM),
+    ("generate", ("gpt-4", "system", ""), _MATCH_USER),
+    ("stream", ("", "system", "user"), _MATCH_MODEL),
+    ("stream", ("gpt-4", "", "user"), _MATCH_SYSTEM),
+    ("stream", ("gpt-4", "system", ""), _MATCH_USER),
+    ("tool_call", ("", "system", "user", _BASIC_TOOL), _MATCH_MODEL),
+    ("tool_call", ("gpt-4", "", "user", _BASIC_TOOL), _MATCH_SYSTEM),
+    ("tool_call", ("gpt-4", "system", "", _BASIC_TOOL), _MATCH_USER),
+    ("tool_call", ("gpt-4", "system", "user", None), _MATCH_TOOLS),
+    ("structured_streaming_output", ("", "system", "user", SampleSchema), _MATCH_MODEL),
+    ("structured_streaming_output", ("gpt-4", "", "user", SampleSchema), _MATCH_SYSTEM),
+    ("structured_streaming_output", ("gpt-4", "system", "", SampleSchema), _MATCH_USER),
+    ("structured_streaming_output", ("gpt-4", "system", "user", None), _MATCH_OUTPUT_SCHEMA),
+])
+def test_validates_required_parameters(provider, method, args, match):
+    """Test that each output mode validates its required parameters."""
+    with pytest.raises(ValidationError, match=match):
+        getattr(provider, method)(*args)
+
 
 
-@patch('streamshape.litellm_integration.litellm.completion')
-def test_generate_returns_complete_text(mock_completion):
+# Unit tests for generate method
+def test_generate_returns_complete_text(mock_completion, provider):
     """Test that generate returns complete text response."""
     # Mock the LiteLLM response
-    mock_response = Mock()
-    mock_response.choices = [Mock()]
-    mock_response.choices[0].message = Mock()
-    mock_response.choices[0].message.content = "This is the complete response"
+    mock_response = make_completion_response("This is the complete response")
     mock_completion.return_value = mock_response
     
-    # Create provider and call generate
-    provider = ConcreteProvider("test_api_key")
+    # Call generate
     result = provider.generate(
         model="gpt-4",
         system_prompt="You are a helpful assistant",
@@ -140,19 +210,17 @@ def test_generate_returns_complete_text(mock_completion):
     assert call_kwargs["messages"][1]["role"] == "user"
 
 
-@patch('streamshape.litellm_integration.litellm.completion')
-def test_generate_forwards_optional_parameters(mock_completion):
-    """Test that generate forwards optional parameters to LiteLLM."""
+@pytest.mark.parametrize("method_name,expect_stream", [("generate", False), ("stream", True)])
+def test_forwards_optional_parameters(mock_completion, provider, method_name, expect_stream):
+    """Test that generate and stream forward optional parameters to LiteLLM."""
     # Mock the LiteLLM response
-    mock_response = Mock()
-    mock_response.choices = [Mock()]
-    mock_response.choices[0].message = Mock()
-    mock_response.choices[0].message.content = "Response"
-    mock_completion.return_value = mock_response
+    if expect_stream:
+        mock_completion.return_value = iter([make_stream_chunk("Response")])
+    else:
+        mock_completion.return_value = make_completion_response("Response")
     
-    # Create provider and call generate with optional params
-    provider = ConcreteProvider("test_api_key")
-    result = provider.generate(
+    # Call with optional params
+    result = getattr(provider, method_name)(
         model="gpt-4",
         system_prompt="System",
         user_prompt="User",
@@ -160,9 +228,12 @@ def test_generate_forwards_optional_parameters(mock_completion):
         max_tokens=100,
         top_p=0.9
     )
+    if expect_stream:
+        list(result)
     
     # Verify optional parameters were forwarded
     call_kwargs = mock_completion.call_args.kwargs
+    assert call_kwargs["stream"] is expect_stream
     assert call_kwargs["temperature"] == 0.7
     assert call_kwargs["max_tokens"] == 100
     assert call_kwargs["top_p"] == 0.9
@@ -170,46 +241,16 @@ def test_generate_forwards_optional_parameters(mock_completion):
 
 
 # Unit tests for stream method
-def test_stream_validates_required_parameters():
-    """Test that stream validates required parameters."""
-    provider = ConcreteProvider("test_api_key")
-    
-    # Test missing model
-    with pytest.raises(ValidationError, match="model"):
-        list(provider.stream("", "system", "user"))
-    
-    # Test missing system_prompt
-    with pytest.raises(ValidationError, match="system_prompt"):
-        list(provider.stream("gpt-4", "", "user"))
-    
-    # Test missing user_prompt
-    with pytest.raises(ValidationError, match="user_prompt"):
-        list(provider.stream("gpt-4", "system", ""))
-
-
-@patch('streamshape.litellm_integration.litellm.completion')
-def test_stream_yields_text_chunks(mock_completion):
+def test_stream_yields_text_chunks(mock_completion, provider):
     """Test that stream yields text chunks as they arrive."""
     # Mock the LiteLLM streaming response
-    mock_chunk1 = Mock()
-    mock_chunk1.choices = [Mock()]
-    mock_chunk1.choices[0].delta = Mock()
-    mock_chunk1.choices[0].delta.content = "Hello"
-    
-    mock_chunk2 = Mock()
-    mock_chunk2.choices = [Mock()]
-    mock_chunk2.choices[0].delta = Mock()
-    mock_chunk2.choices[0].delta.content = " world"
-    
-    mock_chunk3 = Mock()
-    mock_chunk3.choices = [Mock()]
-    mock_chunk3.choices[0].delta = Mock()
-    mock_chunk3.choices[0].delta.content = "!"
+    mock_chunk1 = make_stream_chunk("Hello")
+    mock_chunk2 = make_stream_chunk(" world")
+    mock_chunk3 = make_stream_chunk("!")
     
     mock_completion.return_value = iter([mock_chunk1, mock_chunk2, mock_chunk3])
     
-    # Create provider and call stream
-    provider = ConcreteProvider("test_api_key")
+    # Call stream
     chunks = list(provider.stream(
         model="gpt-4",
         system_prompt="You are a helpful assistant",
@@ -218,14 +259,11 @@ def test_stream_yields_text_chunks(mock_completion):
     
     # Verify the chunks structure
     assert len(chunks) == 3
-    assert all(isinstance(chunk, dict) for chunk in chunks)
-    assert all("data" in chunk and "raw_chunks" in chunk for chunk in chunks)
-    assert chunks[0]["data"] == "Hello"
-    assert chunks[1]["data"] == " world"
-    assert chunks[2]["data"] == "!"
-    assert chunks[0]["raw_chunks"] == mock_chunk1
-    assert chunks[1]["raw_chunks"] == mock_chunk2
-    assert chunks[2]["raw_chunks"] == mock_chunk3
+    expected = zip(chunks, ["Hello", " world", "!"], [mock_chunk1, mock_chunk2, mock_chunk3])
+    for chunk, text, raw in expected:
+        assert isinstance(chunk, dict)
+        assert chunk["data"] == text
+        assert chunk["raw_chunks"] is raw
     
     # Verify LiteLLM was called correctly
     mock_completion.assert_called_once()
@@ -235,58 +273,16 @@ def test_stream_yields_text_chunks(mock_completion):
     assert len(call_kwargs["messages"]) == 2
 
 
-@patch('streamshape.litellm_integration.litellm.completion')
-def test_stream_forwards_optional_parameters(mock_completion):
-    """Test that stream forwards optional parameters to LiteLLM."""
-    # Mock the LiteLLM streaming response
-    mock_chunk = Mock()
-    mock_chunk.choices = [Mock()]
-    mock_chunk.choices[0].delta = Mock()
-    mock_chunk.choices[0].delta.content = "Response"
-    
-    mock_completion.return_value = iter([mock_chunk])
-    
-    # Create provider and call stream with optional params
-    provider = ConcreteProvider("test_api_key")
-    chunks = list(provider.stream(
-        model="gpt-4",
-        system_prompt="System",
-        user_prompt="User",
-        temperature=0.7,
-        max_tokens=100,
-        top_p=0.9
-    ))
-    
-    # Verify optional parameters were forwarded
-    call_kwargs = mock_completion.call_args.kwargs
-    assert call_kwargs["temperature"] == 0.7
-    assert call_kwargs["max_tokens"] == 100
-    assert call_kwargs["top_p"] == 0.9
-
-
-@patch('streamshape.litellm_integration.litellm.completion')
-def test_stream_handles_empty_content(mock_completion):
+def test_stream_handles_empty_content(mock_completion, provider):
     """Test that stream handles chunks with None content."""
     # Mock chunks with some having None content
-    mock_chunk1 = Mock()
-    mock_chunk1.choices = [Mock()]
-    mock_chunk1.choices[0].delta = Mock()
-    mock_chunk1.choices[0].delta.content = "Hello"
-    
-    mock_chunk2 = Mock()
-    mock_chunk2.choices = [Mock()]
-    mock_chunk2.choices[0].delta = Mock()
-    mock_chunk2.choices[0].delta.content = None  # Empty content
-    
-    mock_chunk3 = Mock()
-    mock_chunk3.choices = [Mock()]
-    mock_chunk3.choices[0].delta = Mock()
-    mock_chunk3.choices[0].delta.content = " world"
+    mock_chunk1 = make_stream_chunk("Hello")
+    mock_chunk2 = make_stream_chunk(None)  # Empty content
+    mock_chunk3 = make_stream_chunk(" world")
     
     mock_completion.return_value = iter([mock_chunk1, mock_chunk2, mock_chunk3])
     
-    # Create provider and call stream
-    provider = ConcreteProvider("test_api_key")
+    # Call stream
     chunks = list(provider.stream(
         model="gpt-4",
         system_prompt="System",
@@ -302,72 +298,29 @@ def test_stream_handles_empty_content(mock_completion):
 
 
 # Unit tests for tool_call method
-def test_tool_call_validates_required_parameters():
-    """Test that tool_call validates required parameters."""
-    provider = ConcreteProvider("test_api_key")
-    tools = [{"type": "function", "function": {"name": "test"}}]
-    
-    # Test missing model
-    with pytest.raises(ValidationError, match="model"):
-        provider.tool_call("", "system", "user", tools)
-    
-    # Test missing system_prompt
-    with pytest.raises(ValidationError, match="system_prompt"):
-        provider.tool_call("gpt-4", "", "user", tools)
-    
-    # Test missing user_prompt
-    with pytest.raises(ValidationError, match="user_prompt"):
-        provider.tool_call("gpt-4", "system", "", tools)
-    
-    # Test missing tools
-    with pytest.raises(ValidationError, match="tools"):
-        provider.tool_call("gpt-4", "system", "user", None)
-
-
-def test_tool_call_validates_tools_is_list():
+def test_tool_call_validates_tools_is_list(provider):
     """Test that tool_call validates tools parameter is a list."""
-    provider = ConcreteProvider("test_api_key")
     
     # Test tools is not a list
-    with pytest.raises(ValidationError, match="must be a list"):
+    with pytest.raises(ValidationError, match=_MATCH_MUST_BE_LIST):
         provider.tool_call("gpt-4", "system", "user", "not a list")
     
-    with pytest.raises(ValidationError, match="must be a list"):
+    with pytest.raises(ValidationError, match=_MATCH_MUST_BE_LIST):
         provider.tool_call("gpt-4", "system", "user", {"type": "function"})
 
 
-@patch('streamshape.litellm_integration.litellm.completion')
-def test_tool_call_returns_tool_name_and_arguments(mock_completion):
+def test_tool_call_returns_tool_name_and_arguments(mock_completion, provider):
     """Test that tool_call returns tool name and arguments."""
     # Mock the LiteLLM response with tool call
-    mock_tool_call = Mock()
-    mock_tool_call.function = Mock()
-    mock_tool_call.function.name = "get_weather"
-    mock_tool_call.function.arguments = '{"location": "San Francisco"}'
-    
-    mock_response = Mock()
-    mock_response.choices = [Mock()]
-    mock_response.choices[0].message = Mock()
-    mock_response.choices[0].message.tool_calls = [mock_tool_call]
+    mock_response = make_tool_response("get_weather", '{"location": "San Francisco"}')
     mock_completion.return_value = mock_response
     
-    # Create provider and call tool_call
-    provider = ConcreteProvider("test_api_key")
-    tools = [
-        {
-            "type": "function",
-            "function": {
-                "name": "get_weather",
-                "description": "Get weather",
-                "parameters": {"type": "object", "properties": {}}
-            }
-        }
-    ]
+    # Call tool_call
     result = provider.tool_call(
         model="gpt-4",
         system_prompt="You are a helpful assistant",
         user_prompt="What's the weather?",
-        tools=tools
+        tools=_WEATHER_TOOL
     )
     
     # Verify the result structure
@@ -383,32 +336,21 @@ def test_tool_call_returns_tool_name_and_arguments(mock_completion):
     call_kwargs = mock_completion.call_args.kwargs
     assert call_kwargs["model"] == "test_provider/gpt-4"
     assert call_kwargs["stream"] is False
-    assert call_kwargs["tools"] == tools
+    assert call_kwargs["tools"] == _WEATHER_TOOL
 
 
-@patch('streamshape.litellm_integration.litellm.completion')
-def test_tool_call_forwards_optional_parameters(mock_completion):
+def test_tool_call_forwards_optional_parameters(mock_completion, provider):
     """Test that tool_call forwards optional parameters to LiteLLM."""
     # Mock the LiteLLM response
-    mock_tool_call = Mock()
-    mock_tool_call.function = Mock()
-    mock_tool_call.function.name = "test_tool"
-    mock_tool_call.function.arguments = '{}'
-    
-    mock_response = Mock()
-    mock_response.choices = [Mock()]
-    mock_response.choices[0].message = Mock()
-    mock_response.choices[0].message.tool_calls = [mock_tool_call]
+    mock_response = make_tool_response("test_tool", '{}')
     mock_completion.return_value = mock_response
     
-    # Create provider and call tool_call with optional params
-    provider = ConcreteProvider("test_api_key")
-    tools = [{"type": "function", "function": {"name": "test_tool"}}]
+    # Call tool_call with optional params
     result = provider.tool_call(
         model="gpt-4",
         system_prompt="System",
         user_prompt="User",
-        tools=tools,
+        tools=_BASIC_TOOL,
         temperature=0.7,
         max_tokens=100
     )
@@ -419,24 +361,18 @@ def test_tool_call_forwards_optional_parameters(mock_completion):
     assert call_kwargs["max_tokens"] == 100
 
 
-@patch('streamshape.litellm_integration.litellm.completion')
-def test_tool_call_handles_no_tool_calls(mock_completion):
+def test_tool_call_handles_no_tool_calls(mock_completion, provider):
     """Test that tool_call handles responses with no tool calls."""
     # Mock the LiteLLM response with no tool calls
-    mock_response = Mock()
-    mock_response.choices = [Mock()]
-    mock_response.choices[0].message = Mock()
-    mock_response.choices[0].message.tool_calls = None
+    mock_response = make_tool_response(None)
     mock_completion.return_value = mock_response
     
-    # Create provider and call tool_call
-    provider = ConcreteProvider("test_api_key")
-    tools = [{"type": "function", "function": {"name": "test_tool"}}]
+    # Call tool_call
     result = provider.tool_call(
         model="gpt-4",
         system_prompt="System",
         user_prompt="User",
-        tools=tools
+        tools=_BASIC_TOOL
     )
     
     # Verify the result structure with None values
@@ -450,82 +386,69 @@ def test_tool_call_handles_no_tool_calls(mock_completion):
 
 
 # Unit tests for structured_streaming_output method
-class SampleSchema(BaseModel):
-    """Sample schema for structured output tests."""
-    name: str
-    value: int
-
-
-def test_structured_streaming_output_validates_required_parameters():
-    """Test that structured_streaming_output validates required parameters."""
-    provider = ConcreteProvider("test_api_key")
-    
-    # Test missing model
-    with pytest.raises(ValidationError, match="model"):
-        list(provider.structured_streaming_output("", "system", "user", SampleSchema))
-    
-    # Test missing system_prompt
-    with pytest.raises(ValidationError, match="system_prompt"):
-        list(provider.structured_streaming_output("gpt-4", "", "user", SampleSchema))
-    
-    # Test missing user_prompt
-    with pytest.raises(ValidationError, match="user_prompt"):
-        list(provider.structured_streaming_output("gpt-4", "system", "", SampleSchema))
-    
-    # Test missing output_schema
-    with pytest.raises(ValidationError, match="output_schema"):
-        list(provider.structured_streaming_output("gpt-4", "system", "user", None))
-
-
-def test_structured_streaming_output_validates_schema_is_basemodel():
+def test_structured_streaming_output_validates_schema_is_basemodel(provider):
     """Test that structured_streaming_output validates output_schema is a BaseModel."""
-    provider = ConcreteProvider("test_api_key")
     
     # Test with non-BaseModel type
-    with pytest.raises(ValidationError, match="must be a Pydantic BaseModel class"):
-        list(provider.structured_streaming_output("gpt-4", "system", "user", str))
+    with pytest.raises(ValidationError, match=_MATCH_BASEMODEL):
+        provider.structured_streaming_output("gpt-4", "system", "user", str)
     
-    with pytest.raises(ValidationError, match="must be a Pydantic BaseModel class"):
-        list(provider.structured_streaming_output("gpt-4", "system", "user", dict))
+    with pytest.raises(ValidationError, match=_MATCH_BASEMODEL):
+        provider.structured_streaming_output("gpt-4", "system", "user", dict)
     
-    with pytest.raises(ValidationError, match="must be a Pydantic BaseModel class"):
-        list(provider.structured_streaming_output("gpt-4", "system", "user", "not a class"))
+    with pytest.raises(ValidationError, match=_MATCH_BASEMODEL):
+        provider.structured_streaming_output("gpt-4", "system", "user", "not a class")
 
 
-@patch('streamshape.parser_integration.parse_streaming_response')
-@patch('streamshape.litellm_integration.litellm.completion')
-def test_structured_streaming_output_yields_validated_objects(mock_completion, mock_parser):
-    """Test that structured_streaming_output yields validated Pydantic objects."""
-    # Mock the LiteLLM streaming response
-    mock_response = Mock()
-    mock_completion.return_value = mock_response
+@pytest.fixture(scope="module")
+def structured_call(_provider_template):
+    """
+    Run structured_streaming_output once against mocked LiteLLM and parser.
     
-    # Mock the parser to yield validated objects in the expected format
-    obj1 = SampleSchema(name="test1", value=1)
-    obj2 = SampleSchema(name="test2", value=2)
-    mock_parser.return_value = iter([
-        {"data": obj1, "usage": {}, "finished": False},
-        {"data": obj2, "usage": {}, "finished": False},
+    The module-scoped result is shared by the structured streaming tests,
+    which only differ in what they assert about this single call.
+    """
+    completion = Mock(return_value=Mock())
+    parser = Mock(return_value=iter([
+        {"data": _SAMPLE_1, "usage": {}, "finished": False},
+        {"data": _SAMPLE_2, "usage": {}, "finished": False},
         {"data": None, "usage": {}, "finished": True}
-    ])
-    
-    # Create provider and call structured_streaming_output
-    provider = ConcreteProvider("test_api_key")
-    results = list(provider.structured_streaming_output(
-        model="gpt-4",
-        system_prompt="You are a helpful assistant",
-        user_prompt="Generate data",
-        output_schema=SampleSchema
-    ))
+    ]))
+    
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(_li.litellm, "completion", completion)
+        mp.setattr(_pi, "parse_streaming_response", parser)
+        results = list(copy.copy(_provider_template).structured_streaming_output(
+            model="gpt-4",
+            system_prompt="You are a helpful assistant",
+            user_prompt="Generate data",
+            output_schema=SampleSchema,
+            temperature=0.7,
+            max_tokens=100
+        ))
+    
+    return SimpleNamespace(
+        results=results,
+        completion=completion,
+        call_kwargs=completion.call_args.kwargs,
+        parser=parser
+    )
+
+
+def test_structured_streaming_output_yields_validated_objects(structured_call):
+    """Test that structured_streaming_output yields validated Pydantic objects."""
+    results = structured_call.results
     
-    # Verify the results
-    assert len(results) == 2
-    assert results[0] == obj1
-    assert results[1] == obj2
+    # Verify the parser's result dictionaries are passed through, final chunk included
+    assert len(results) == 3
+    assert results[0]["data"] == _SAMPLE_1
+    assert results[1]["data"] == _SAMPLE_2
+    assert results[2]["data"] is None
+    assert results[2]["finished"] is True
     
     # Verify LiteLLM was called correctly
-    mock_completion.assert_called_once()
-    call_kwargs = mock_completion.call_args.kwargs
+    structured_call.completion.assert_called_once()
+    call_kwargs = structured_call.call_kwargs
     assert call_kwargs["model"] == "test_provider/gpt-4"
     assert call_kwargs["stream"] is True
     assert "response_format" in call_kwargs
@@ -536,60 +459,21 @@ def test_structured_streaming_output_yields_validated_objects(mock_completion, m
     assert "Output only the JSON array" in messages[1]["content"]
     
     # Verify parser was called with correct arguments
-    mock_parser.assert_called_once_with(mock_response, SampleSchema)
+    structured_call.parser.assert_called_once_with(structured_call.completion.return_value, SampleSchema)
 
 
-@patch('streamshape.parser_integration.parse_streaming_response')
-@patch('streamshape.litellm_integration.litellm.completion')
-def test_structured_streaming_output_forwards_optional_parameters(mock_completion, mock_parser):
+def test_structured_streaming_output_forwards_optional_parameters(structured_call):
     """Test that structured_streaming_output forwards optional parameters to LiteLLM."""
-    # Mock the LiteLLM streaming response
-    mock_response = Mock()
-    mock_completion.return_value = mock_response
-    
-    # Mock the parser
-    mock_parser.return_value = iter([])
-    
-    # Create provider and call with optional params
-    provider = ConcreteProvider("test_api_key")
-    list(provider.structured_streaming_output(
-        model="gpt-4",
-        system_prompt="System",
-        user_prompt="User",
-        output_schema=SampleSchema,
-        temperature=0.7,
-        max_tokens=100
-    ))
-    
     # Verify optional parameters were forwarded
-    call_kwargs = mock_completion.call_args.kwargs
+    call_kwargs = structured_call.call_kwargs
     assert call_kwargs["temperature"] == 0.7
     assert call_kwargs["max_tokens"] == 100
 
 
-@patch('streamshape.parser_integration.parse_streaming_response')
-@patch('streamshape.litellm_integration.litellm.completion')
-def test_structured_streaming_output_builds_correct_response_format(mock_completion, mock_parser):
+def test_structured_streaming_output_builds_correct_response_format(structured_call):
     """Test that structured_streaming_output builds correct response_format."""
-    # Mock the LiteLLM streaming response
-    mock_response = Mock()
-    mock_completion.return_value = mock_response
-    
-    # Mock the parser
-    mock_parser.return_value = iter([])
-    
-    # Create provider and call
-    provider = ConcreteProvider("test_api_key")
-    list(provider.structured_streaming_output(
-        model="gpt-4",
-        system_prompt="System",
-        user_prompt="User",
-        output_schema=SampleSchema
-    ))
-    
     # Verify response_format structure
-    call_kwargs = mock_completion.call_args.kwargs
-    response_format = call_kwargs["response_format"]
+    response_format = structured_call.call_kwargs["response_format"]
     
     assert response_format["type"] == "json_schema"
     assert "json_schema" in response_format
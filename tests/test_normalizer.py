@@ -2,10 +2,6 @@
 
 from __future__ import annotations
 
-import sys
-import os
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
-
 import json
 from typing import List
 from unittest.mock import patch
@@ -18,6 +14,7 @@ from streamshape.exceptions import ValidationError
 from tests.mock_outputs.mock_data import openai as openai_mock
 from tests.mock_outputs.mock_data import google as google_mock
 from tests.mock_outputs.mock_data import anthropic as anthropic_mock
+from tests._mocks import make_completion_response, make_stream_chunk
 
 
 class City(BaseModel):
@@ -27,64 +24,75 @@ class City(BaseModel):
     temperature_c: int = Field(description="Temperature in Celsius")
 
 
-def test_openai_generate_with_mock_data() -> None:
-    """Test OpenAI provider's generate method with mock data."""
-    mock_response = openai_mock.get_simple_text_response()
-    
-    with patch("streamshape.litellm_integration.litellm.completion", return_value=mock_response):
-        provider = OpenAI(api_key="test-key")
-        result = provider.generate(
-            model="gpt-4",
-            system_prompt="You are a helpful assistant.",
-            user_prompt="Tell me a joke"
-        )
-        
-        assert isinstance(result, dict)
-        assert "data" in result
-        assert "raw_chunks" in result
-        assert isinstance(result["data"], str)
-        assert "joke" in result["data"].lower()
+# JSON array payloads for the structured output tests, serialized once at import
+_CITIES_3_JSON = json.dumps([
+    {"city": "Tokyo", "condition": "Partly Cloudy", "temperature_c": 22},
+    {"city": "London", "condition": "Rainy", "temperature_c": 15},
+    {"city": "Delhi", "condition": "Hazy", "temperature_c": 28}
+])
+_CITIES_2_JSON = json.dumps([
+    {"city": "Paris", "condition": "Sunny", "temperature_c": 20},
+    {"city": "London", "condition": "Rainy", "temperature_c": 15}
+])
 
 
-def test_google_generate_with_mock_data() -> None:
-    """Test Google provider's generate method with mock data."""
-    # Google returns native objects, so we need to create a normalized mock
-    from unittest.mock import Mock
-    
-    mock_response = Mock()
-    mock_response.choices = [Mock()]
-    mock_response.choices[0].message = Mock()
-    mock_response.choices[0].message.content = "Why did the programmer quit his job? Because he didn't get arrays!"
-    
-    with patch("streamshape.litellm_integration.litellm.completion", return_value=mock_response):
-        provider = Google(api_key="test-key")
-        result = provider.generate(
-            model="gemini-pro",
-            system_prompt="You are a helpful assistant.",
-            user_prompt="Tell me a joke"
-        )
-        
-        assert isinstance(result, dict)
-        assert "data" in result
-        assert "raw_chunks" in result
-        assert isinstance(result["data"], str)
-        assert len(result["data"]) > 0
+@pytest.fixture
+def openai_text_response():
+    """Recorded OpenAI completion."""
+    return openai_mock.get_simple_text_response()
 
 
-def test_anthropic_generate_with_mock_data() -> None:
-    """Test Anthropic provider's generate method with mock data."""
-    # Anthropic returns native objects, so we need to create a normalized mock
-    from unittest.mock import Mock
-    
-    mock_response = Mock()
-    mock_response.choices = [Mock()]
-    mock_response.choices[0].message = Mock()
-    mock_response.choices[0].message.content = "Why don't scientists trust atoms? Because they make up everything!"
+@pytest.fixture(scope="module")
+def google_text_response():
+    """Normalized Google completion; Google returns native objects."""
+    return make_completion_response("Why did the programmer quit his job? Because he didn't get arrays!")
+
+
+@pytest.fixture(scope="module")
+def anthropic_text_response():
+    """Normalized Anthropic completion; Anthropic returns native objects."""
+    return make_completion_response("Why don't scientists trust atoms? Because they make up everything!")
+
+
+@pytest.fixture
+def openai_stream_chunks():
+    """Recorded OpenAI stream, replayed lazily like the live API."""
+    return openai_mock.get_streaming_response()
+
+
+@pytest.fixture(scope="module")
+def google_stream_chunks():
+    """Normalized Google streaming chunks, built once per module."""
+    texts = ("Why ", "did ", "the ", "chicken ", "cross ", "the ", "road?")
+    return tuple(make_stream_chunk(text) for text in texts)
+
+
+@pytest.fixture(scope="module")
+def anthropic_stream_chunks():
+    """Normalized Anthropic streaming chunks, built once per module."""
+    texts = ("Here's ", "a ", "joke: ", "Why ", "don't ", "atoms ", "trust ", "each ", "other?")
+    return tuple(make_stream_chunk(text) for text in texts)
+
+
+@pytest.fixture(scope="module")
+def city_response_format():
+    """City's response_format, built once per module."""
+    return OpenAI(api_key="test-key")._build_response_format(City)
+
+
+@pytest.mark.parametrize("provider_cls,model,response_fixture,expected", [
+    (OpenAI, "gpt-4", "openai_text_response", "joke"),
+    (Google, "gemini-pro", "google_text_response", "arrays"),
+    (Anthropic, "claude-3-opus", "anthropic_text_response", "atoms"),
+], ids=["openai", "google", "anthropic"])
+def test_generate_with_mock_data(request, provider_cls, model, response_fixture, expected) -> None:
+    """Test each provider's generate method with mock data."""
+    mock_response = request.getfixturevalue(response_fixture)
     
     with patch("streamshape.litellm_integration.litellm.completion", return_value=mock_response):
-        provider = Anthropic(api_key="test-key")
+        provider = provider_cls(api_key="test-key")
         result = provider.generate(
-            model="claude-3-opus",
+            model=model,
             system_prompt="You are a helpful assistant.",
             user_prompt="Tell me a joke"
         )
@@ -93,7 +101,7 @@ def test_anthropic_generate_with_mock_data() -> None:
         assert "data" in result
         assert "raw_chunks" in result
         assert isinstance(result["data"], str)
-        assert len(result["data"]) > 0
+        assert expected in result["data"].lower()
 
 
 def test_tool_call_with_mock_data() -> None:
@@ -132,96 +140,35 @@ def test_tool_call_with_mock_data() -> None:
         assert "Berlin" in result["data"]["arguments"]
 
 
-def test_streaming_with_mock_data() -> None:
-    """Test streaming functionality with mock data."""
-    mock_stream = openai_mock.get_streaming_response()
+@pytest.mark.parametrize("provider_cls,model,chunks_fixture", [
+    (OpenAI, "gpt-4", "openai_stream_chunks"),
+    (Google, "gemini-pro", "google_stream_chunks"),
+    (Anthropic, "claude-3-opus", "anthropic_stream_chunks"),
+], ids=["openai", "google", "anthropic"])
+def test_streaming_with_mock_data(request, provider_cls, model, chunks_fixture) -> None:
+    """Test each provider's streaming with mock data."""
+    mock_stream = iter(request.getfixturevalue(chunks_fixture))
     
     with patch("streamshape.litellm_integration.litellm.completion", return_value=mock_stream):
-        provider = OpenAI(api_key="test-key")
-        chunks = list(provider.stream(
-            model="gpt-4",
-            system_prompt="You are a helpful assistant.",
-            user_prompt="Tell me a joke"
-        ))
-        
-        assert len(chunks) > 0
-        assert all(isinstance(chunk, dict) for chunk in chunks)
-        assert all("data" in chunk and "raw_chunks" in chunk for chunk in chunks)
-        full_text = "".join([chunk["data"] for chunk in chunks])
-        assert len(full_text) > 0
-
-
-def test_google_streaming_with_mock_data() -> None:
-    """Test Google provider's streaming with mock data."""
-    # Create normalized streaming chunks
-    from unittest.mock import Mock
-    
-    mock_chunks = []
-    for text in ["Why ", "did ", "the ", "chicken ", "cross ", "the ", "road?"]:
-        chunk = Mock()
-        chunk.choices = [Mock()]
-        chunk.choices[0].delta = Mock()
-        chunk.choices[0].delta.content = text
-        mock_chunks.append(chunk)
-    
-    with patch("streamshape.litellm_integration.litellm.completion", return_value=iter(mock_chunks)):
-        provider = Google(api_key="test-key")
-        chunks = list(provider.stream(
-            model="gemini-pro",
+        provider = provider_cls(api_key="test-key")
+        parts: List[str] = []
+        for chunk in provider.stream(
+            model=model,
             system_prompt="You are a helpful assistant.",
             user_prompt="Tell me a joke"
-        ))
+        ):
+            assert isinstance(chunk, dict) and "data" in chunk and "raw_chunks" in chunk
+            parts.append(chunk["data"])
         
-        assert len(chunks) > 0
-        assert all(isinstance(chunk, dict) for chunk in chunks)
-        assert all("data" in chunk and "raw_chunks" in chunk for chunk in chunks)
-        full_text = "".join([chunk["data"] for chunk in chunks])
-        assert len(full_text) > 0
-
-
-def test_anthropic_streaming_with_mock_data() -> None:
-    """Test Anthropic provider's streaming with mock data."""
-    # Create normalized streaming chunks
-    from unittest.mock import Mock
-    
-    mock_chunks = []
-    for text in ["Here's ", "a ", "joke: ", "Why ", "don't ", "atoms ", "trust ", "each ", "other?"]:
-        chunk = Mock()
-        chunk.choices = [Mock()]
-        chunk.choices[0].delta = Mock()
-        chunk.choices[0].delta.content = text
-        mock_chunks.append(chunk)
-    
-    with patch("streamshape.litellm_integration.litellm.completion", return_value=iter(mock_chunks)):
-        provider = Anthropic(api_key="test-key")
-        chunks = list(provider.stream(
-            model="claude-3-opus",
-            system_prompt="You are a helpful assistant.",
-            user_prompt="Tell me a joke"
-        ))
-        
-        assert len(chunks) > 0
-        assert all(isinstance(chunk, dict) for chunk in chunks)
-        assert all("data" in chunk and "raw_chunks" in chunk for chunk in chunks)
-        full_text = "".join([chunk["data"] for chunk in chunks])
-        assert len(full_text) > 0
+        assert len(parts) > 0
+        assert len("".join(parts)) > 0
 
 
 def test_structured_output_with_mock_data() -> None:
     """Test structured output with mock data."""
     # The mock returns {"cities": [...]}, but structured_output expects [...]
     # So we create a proper mock response with an array
-    from unittest.mock import Mock
-    import json
-    
-    mock_response = Mock()
-    mock_response.choices = [Mock()]
-    mock_response.choices[0].message = Mock()
-    mock_response.choices[0].message.content = json.dumps([
-        {"city": "Tokyo", "condition": "Partly Cloudy", "temperature_c": 22},
-        {"city": "London", "condition": "Rainy", "temperature_c": 15},
-        {"city": "Delhi", "condition": "Hazy", "temperature_c": 28}
-    ])
+    mock_response = make_completion_response(_CITIES_3_JSON)
     
     with patch("streamshape.litellm_integration.litellm.completion", return_value=mock_response):
         provider = OpenAI(api_key="test-key")
@@ -290,15 +237,7 @@ def test_validation_errors() -> None:
 def test_structured_output_validation() -> None:
     """Test structured output with schema validation."""
     # Create a mock response with JSON array
-    from unittest.mock import Mock
-    
-    mock_response = Mock()
-    mock_response.choices = [Mock()]
-    mock_response.choices[0].message = Mock()
-    mock_response.choices[0].message.content = json.dumps([
-        {"city": "Paris", "condition": "Sunny", "temperature_c": 20},
-        {"city": "London", "condition": "Rainy", "temperature_c": 15}
-    ])
+    mock_response = make_completion_response(_CITIES_2_JSON)
     
     with patch("streamshape.litellm_integration.litellm.completion", return_value=mock_response):
         provider = OpenAI(api_key="test-key")
@@ -346,10 +285,9 @@ def test_message_building() -> None:
     assert messages[1]["content"] == "User prompt"
 
 
-def test_response_format_building() -> None:
+def test_response_format_building(city_response_format) -> None:
     """Test that response format is built correctly for structured output."""
-    provider = OpenAI(api_key="test-key")
-    response_format = provider._build_response_format(City)
+    response_format = city_response_format
     
     assert response_format["type"] == "json_schema"
     assert "json_schema" in response_format
@@ -360,25 +298,17 @@ def test_response_format_building() -> None:
 
 def test_multiple_providers_consistency() -> None:
     """Test that all providers work consistently with normalized mock responses."""
-    from unittest.mock import Mock
-    
-    # Create a normalized mock response that works for all providers
-    def create_mock_response(content: str):
-        mock_response = Mock()
-        mock_response.choices = [Mock()]
-        mock_response.choices[0].message = Mock()
-        mock_response.choices[0].message.content = content
-        return mock_response
-    
     providers = [
         OpenAI(api_key="test-key"),
         Google(api_key="test-key"),
         Anthropic(api_key="test-key"),
     ]
     
-    for provider in providers:
-        mock_response = create_mock_response("This is a test joke!")
-        with patch("streamshape.litellm_integration.litellm.completion", return_value=mock_response):
+    # Create a normalized mock response that works for all providers
+    mock_response = make_completion_response("This is a test joke!")
+    
+    with patch("streamshape.litellm_integration.litellm.completion", return_value=mock_response):
+        for provider in providers:
             result = provider.generate(
                 model="test-model",
                 system_prompt="You are a helpful assistant.",